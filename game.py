@@ -1,6 +1,23 @@
 import player
 import room 
 import save_load
+from item import find_item_index
+
+# Static help text, built once instead of on every 'help' command
+HELP_TEXT = """
+Avaliable Commands:
+ - go <direction>: Move to another room.
+ - look: Look around the current room.
+ - pick up <item>: Pick up an item from the current room.
+ - attack: Attack an enemy during combat.
+ - use <item>: Use an item from your inventory.
+ - inventory: Check your inventory.
+ - save: Save your current progress.
+ - load: Load a previously saved game.
+ - quit: Quit the game."""
+
+class GameOver(Exception):
+    """Raised when the player is defeated, ending the game."""
 
 def handle_combat(player, enemies):
     """Handles a combat encounter between the player and a list of enemies."""
@@ -21,8 +38,7 @@ def handle_combat(player, enemies):
         for enemy in enemies:
             enemy.attack(player)
             if player.health <= 0:
-                print("You have been defeated!")
-                return
+                raise GameOver("You have been defeated!")
 
         # Check for victory
         if not enemies:
@@ -36,8 +52,6 @@ def main():
     current_room = room.get_starting_room()  
     player_character = player.create_player()  
 
-    input_history = []
-
     # 2. Main game loop
     while True: 
         # 2.1 Display the current room and player status
@@ -49,22 +63,26 @@ def main():
             action = input("> ").lower()
         except KeyboardInterrupt:
             break
-        input_history.append(action)
 
         # 2.3 Handle player actions
         if action.startswith("cd"):
             parts = action.split()  
             if len(parts) == 2:
                 direction = parts[1]
-                if direction in current_room.exits:
-                    current_room = room.get_room_by_name(current_room.exits[direction])  
+                next_room = room.get_room_by_name(current_room.exits.get(direction))
+                if next_room:
+                    current_room = next_room
                 else:
                     print("You can't go that way.")
             else:
                 print("Invalid 'cd' command. Usage: cd <direction>")
                 
             if current_room.enemies:
-                handle_combat(player_character, current_room.enemies)
+                try:
+                    handle_combat(player_character, current_room.enemies)
+                except GameOver as e:
+                    print(e)
+                    break
                 
         elif action.startswith("ls"):
             current_room.describe()
@@ -78,34 +96,25 @@ def main():
                 print("You couldn't find anything.")
            
         elif action == "help":
-            print("\nAvaliable Commands:")
-            print(" - go <direction>: Move to another room.")
-            print(" - look: Look around the current room.")
-            print(" - pick up <item>: Pick up an item from the current room.")
-            print(" - attack: Attack an enemy during combat.")
-            print(" - use <item>: Use an item from your inventory.")
-            print(" - inventory: Check your inventory.")
-            print(" - save: Save your current progress.")
-            print(" - load: Load a previously saved game.")
-            print(" - quit: Quit the game.")
+            print(HELP_TEXT)
 
         elif action.startswith("use"):
             parts = action.split()
             if len(parts) == 2:
                 item_name = parts[1]
-                for item in player_character.inventory:
-                    if item.name.lower() == item_name.lower():
-                        message = item.use()
-                        print(message)
-                        if item.heal > 0:
-                            player_character.health += item.heal
-                            player_character.inventory.remove(item)
-                        elif item.key_for:
-                            if current_room.name == item.key_for: 
-                                print(f"You used the {item.name} to unlock the door!")
-                            else:
-                                print(f"The {item.name} doesn’t seem to work here.")
-                        break
+                index = find_item_index(player_character.inventory, item_name)
+                if index is not None:
+                    item = player_character.inventory[index]
+                    message = item.use()
+                    print(message)
+                    if item.heal > 0:
+                        player_character.health += item.heal
+                        player_character.inventory.pop(index)
+                    elif item.key_for:
+                        if current_room.name == item.key_for: 
+                            print(f"You used the {item.name} to unlock the door!")
+                        else:
+                            print(f"The {item.name} doesn’t seem to work here.")
                 else:
                     print(f"You don't have a {item_name} in your inventory.")
             else:
@@ -118,17 +127,13 @@ def main():
                 print("Please specify the item you want to pick up. Usage: pick up <item name>")
             else:
                 item_name = parts[1].strip()
-                found_item = None
-                for item in current_room.items:
-                    if item.name.lower() == item_name.lower():
-                        found_item = item
-                        break
-                if found_item:
+                index = find_item_index(current_room.items, item_name)
+                if index is not None:
+                    found_item = current_room.items.pop(index)
                     player_character.inventory.append(found_item)
-                    current_room.items.remove(found_item)
                     print(f"You picked up {found_item.name}!")
                 else:
-                    print(f"There is no {item.name} here.") 
+                    print(f"There is no {item_name} here.") 
                     
         elif action.startswith("talk to "):
             npc_name = action.split("talk to ")[1].strip()
@@ -145,6 +150,9 @@ def main():
             else:
                 print(f"There is no one neame {npc_name} here.")
 
+        elif action == "inventory":
+            player_character.display_inventory()
+
         elif action == "look":
             current_room.describe()
 
@@ -29,16 +29,29 @@ class Item:
         }
      
     def use(self):
-        if self.name == "Computer Manual":
-            return "This manual shows a section titled 'Bypassing Security Protocol.' It mentions something about the aligning the server nodes in the correct sequence to disable the firewall. I think this has to do with the 'Server Room'."
-        elif self.name == "Ancient Map":
-            return """
+        message = USE_MESSAGES.get(self.name)
+        if message:
+            return message
+        return f"You used the {self.name}, but nothing significant happened."
+
+# Special messages for items that do something when used, keyed by item name
+USE_MESSAGES = {
+    "Computer Manual": "This manual shows a section titled 'Bypassing Security Protocol.' It mentions something about the aligning the server nodes in the correct sequence to disable the firewall. I think this has to do with the 'Server Room'.",
+    "Ancient Map": """
             Level 1 Map:
             - Closet -> Bedroom -> Hallway -> Bathroom
             - Hallway -> Kitchen
             - Hallway -> Basement -> Server Room
             """
-        return f"You used the {self.name}, but nothing significant happened."
+}
+
+def find_item_index(items, item_name):
+    """Returns the index of the first item in a list whose name matches, ignoring case."""
+    item_name = item_name.lower()
+    for index, item in enumerate(items):
+        if item.name.lower() == item_name:
+            return index
+    return None
     
 pocket_knife = Item(
     name="Pocket Knife", 
@@ -1,31 +1,43 @@
 class Player:
+    __slots__ = ("name", "health", "mana", "strength", "inventory", "active_quests")
+
     def __init__(self, name, starting_health=100, starting_mana=50, starting_strength=10):
         self.name = name
         self.health = starting_health
         self.mana = starting_mana
         self.strength = starting_strength
         self.inventory = []  # Start with an empty inventory
+        self.active_quests = []
 
     def display_status(self):
-        print(f"Name: {self.name}")
-        print(f"Health: {self.health}")
-        print(f"Mana: {self.mana}")
-        print(f"Strength: {self.strength}")
-        print("Inventory:", ", ".join([item.name for item in self.inventory]) or "Empty")   
+        inventory = ", ".join([item.name for item in self.inventory]) or "Empty"
+        print(f"Name: {self.name}\n"
+              f"Health: {self.health}\n"
+              f"Mana: {self.mana}\n"
+              f"Strength: {self.strength}\n"
+              f"Inventory: {inventory}")
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "health": self.health,
+            "mana": self.mana,
+            "strength": self.strength,
+            "inventory": [item.to_dict() for item in self.inventory]
+        }
 
     def attack(self, target):
         damage = self.strength
         target.health -= damage
         print(f"{self.name} attacks {target.name} for {damage} damage! HP: {target.health}") # Display the attack and target's Health
 
+    def display_inventory(self):
+        if self.inventory:
+            lines = [f" - {item.name}: {item.description}" for item in self.inventory]
+            print("\nYour Inventory:\n" + "\n".join(lines))
+        else:
+            print("\nYour inventory is empty.")
+
 def create_player():
     name = input("Enter your character's name: ")
-    return Player(name)
-
-def display_inventory(self):
-    if self.inventory:
-        print("\nYour Inventory:")
-        for item in self.inventory:
-            print(f" - {item.name}: {item.description}")
-    else:
-        print("\nYour inventory is empty.")
\ No newline at end of file
+    return Player(name)
\ No newline at end of file
@@ -12,34 +12,39 @@ class Room:
         self.npcs = npcs or [] 
 
     def describe(self):
-        print(f"\n{self.name}")
-        print("-" * len(self.name))
-        print(self.description)
-
+        lines = [f"\n{self.name}", "-" * len(self.name), self.description]
 
         if self.exits:
-            print("Exits:", ", ".join(self.exits.keys()))
+            lines.append("Exits: " + ", ".join(self.exits.keys()))
 
         if self.items:
-            print("Items:", ", ".join([item.name for item in self.items])) 
+            lines.append("Items: " + ", ".join([item.name for item in self.items]))
 
         if self.enemies:
-            print("Enemies:", ", ".join([enemy.name for enemy in self.enemies]))  
+            lines.append("Enemies: " + ", ".join([enemy.name for enemy in self.enemies]))
+
+        print("\n".join(lines))  # Print the whole description in one write
 
 
 all_rooms = {}
 
 def get_starting_room():
-    
-    closet = Room("Closet", "A dark and cramped closet.", {"out": "Bedroom"}, items=[flashlight])
-    all_rooms["Closet"] = closet 
-    return closet
+    """Returns the room the player starts in."""
+    return all_rooms["Closet"]
 
 def get_room_by_name(name):
     """Retrieves a room object by its name."""
     return all_rooms.get(name)  
 
 
+closet = Room(
+    name="Closet", 
+    description="A dark and cramped closet.", 
+    exits={"out": "Bedroom"}, 
+    items=[flashlight]
+)
+all_rooms["Closet"] = closet
+
 bedroom = Room(
     name="Bedroom", 
     description="A dimly lit bedroom with an unsettling feeling.", 
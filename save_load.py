@@ -1,25 +1,27 @@
 import json 
+import os
 from player import Player
+from item import Item
+from room import get_room_by_name
 
-def save_game(player, current_room):
-    """Saves the game state to a file."""
-    # Convert inventory items to a list of dictionaries
-    inventory_as_dicts = [item.to_dict() for item in player.inventory]
-
+def save_game(player, current_room, pretty=False):
+    """Saves the game state to a file. Pass pretty=True for an indented, human-readable file."""
     data = {
-        "player": {
-            "name": player.name,
-            "health": player.health,
-            "mana": player.mana,
-            "strength": player.strength,
-            "inventory": inventory_as_dicts
-        },
+        "player": player.to_dict(),
         "current_room": current_room.name 
     }
 
     try:
-        with open("save_game.json", "w") as save_file:
-            json.dump(data, save_file, indent=4)  # Save data in a nicely formatted JSON file
+        # Write to a temporary file first so a crash can't leave a half-written save
+        with open("save_game.json.tmp", "w") as save_file:
+            if pretty:
+                json.dump(data, save_file, indent=4)
+            else:
+                # json.dumps encodes in C in one go; json.dump would write chunk by chunk
+                save_file.write(json.dumps(data, separators=(",", ":")))
+            save_file.flush()
+            os.fsync(save_file.fileno())
+        os.replace("save_game.json.tmp", "save_game.json")
         print("Game saved successfully!")
     except Exception as e:
         print(f"Error saving game: {e}")
@@ -40,7 +42,6 @@ def load_game():
         )
 
         # Convert inventory dictionaries back to Item instances
-        from item import Item
         player.inventory = [Item(**item_data) for item_data in data["player"]["inventory"]]
 
         # Get the current room
@@ -54,9 +55,4 @@ def load_game():
         return None, None
     except Exception as e:
         print(f"Error loading game: {e}")
-        return None, None
-
-def get_room_by_name(room_name):
-    
-    global all_rooms
-    return all_rooms.get(room_name, None)
\ No newline at end of file
+        return None, None
\ No newline at end of file